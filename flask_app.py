@@ -1,8 +1,14 @@
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
+import orjson
 from flask_cors import CORS
 from newspaper import Article, ArticleException
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, UnicodeDammit
+import lxml.html
+from lxml import etree
 import json
 import logging
 from datetime import datetime
@@ -13,7 +19,13 @@ import re
 from readability import Document
 import trafilatura
 from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import os
+import queue
+import threading
+import atexit
+import hashlib
+import diskcache
 
 # Optional Selenium imports (may not work in all environments)
 SELENIUM_AVAILABLE = False
@@ -34,9 +46,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _orjson_default(obj):
+    """Serialize types orjson doesn't handle natively"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+    
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj).decode()
+    
+    def dumps_bytes(self, obj):
+        """Serialize obj straight to UTF-8 JSON bytes"""
+        return orjson.dumps(obj, default=_orjson_default, option=self.option)
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping a str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype='application/json')
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for all routes
 
+# On-disk cache of scrape results, keyed by URL
+CACHE_TTL = int(os.environ.get('SCRAPE_CACHE_TTL', 3600))
+CACHE = diskcache.Cache(os.environ.get('SCRAPE_CACHE_DIR', '/tmp/scrape'), size_limit=2 << 30)
+# Stale entries, and the ETag/Last-Modified of the page GETs behind them, are
+# kept this long so they can be revalidated with the origin
+CACHE_RETENTION = CACHE_TTL * 24
+
 # Multiple User Agents for rotation
 USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -47,10 +92,23 @@ USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/120.0.0.0',
 ]
 
-def get_random_headers():
-    """Generate random headers to avoid bot detection"""
-    return {
-        'User-Agent': random.choice(USER_AGENTS),
+# Shared HTTP session so repeated requests reuse pooled keep-alive connections
+SESSION = requests.Session()
+# Ignore Retry-After: anti-bot 429/503 answers can ask for minutes, which timeout=15
+# doesn't bound; plain backoff keeps the worst case to a couple of seconds
+_retry = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=False,
+)
+SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_retry))
+SESSION.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_retry))
+
+# One complete header set per User-Agent, built once at import
+HEADER_POOL = [
+    {
+        'User-Agent': user_agent,
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
         'Accept-Encoding': 'gzip, deflate, br',
@@ -62,15 +120,60 @@ def get_random_headers():
         'Sec-Fetch-Site': 'none',
         'Cache-Control': 'max-age=0',
     }
+    for user_agent in USER_AGENTS
+]
 
-@contextmanager
-def get_selenium_driver():
-    """Context manager for Selenium WebDriver"""
-    if not SELENIUM_AVAILABLE:
-        logger.warning("Selenium not available, skipping")
-        yield None
-        return
-        
+def get_random_headers():
+    """Pick random headers to avoid bot detection (shared dict, copy before mutating)"""
+    return HEADER_POOL[random.randrange(len(HEADER_POOL))]
+
+# Work currently in progress, keyed by caller-chosen key
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def coalesce(key, func, *args, **kwargs):
+    """Run func once and share its outcome with concurrent callers using the same key"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+    if not owner:
+        return future.result()
+    try:
+        result = func(*args, **kwargs)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+def get_cache_key(url):
+    """Key for a URL's cached scrape result"""
+    return hashlib.sha256(url.encode()).hexdigest()
+
+def _get_page(url):
+    """GET a page and remember its cache validators for later revalidation"""
+    response = SESSION.get(url, headers=get_random_headers(), timeout=15)
+    if response.status_code == 200:
+        validators_key = get_cache_key(url) + ':validators'
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            CACHE.set(validators_key, {'etag': etag, 'last_modified': last_modified}, expire=CACHE_RETENTION)
+        else:
+            CACHE.delete(validators_key)
+    return response
+
+def fetch_page(url):
+    """GET a page, sharing one in-flight request between strategies racing on the same URL"""
+    return coalesce(('page', url), _get_page, url)
+
+def launch_selenium_driver():
+    """Start a new headless Chrome WebDriver, or return None on failure"""
     chrome_options = Options()
     chrome_options.add_argument('--headless=new')  # Updated headless mode
     chrome_options.add_argument('--no-sandbox')
@@ -81,7 +184,17 @@ def get_selenium_driver():
     chrome_options.add_argument('--window-size=1920,1080')
     chrome_options.add_argument('--single-process')
     chrome_options.add_argument('--disable-software-rasterizer')
-    chrome_options.add_argument('--remote-debugging-port=9222')
+    # Only the DOM is needed: skip images and background traffic
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+    # Return from driver.get() once the DOM is interactive, not after onload
+    chrome_options.page_load_strategy = 'eager'
+    # Let Chrome pick a free debugging port so pooled browsers don't collide
+    chrome_options.add_argument('--remote-debugging-port=0')
     chrome_options.add_argument(f'user-agent={random.choice(USER_AGENTS)}')
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
@@ -91,7 +204,6 @@ def get_selenium_driver():
     if chrome_bin:
         chrome_options.binary_location = chrome_bin
     
-    driver = None
     try:
         from selenium.webdriver.chrome.service import Service
         
@@ -104,7 +216,6 @@ def get_selenium_driver():
             # Use webdriver-manager to auto-install ChromeDriver
             try:
                 from webdriver_manager.chrome import ChromeDriverManager
-                from webdriver_manager.core.os_manager import ChromeType
                 service = Service(ChromeDriverManager().install())
                 driver = webdriver.Chrome(service=service, options=chrome_options)
             except Exception as wdm_error:
@@ -112,132 +223,276 @@ def get_selenium_driver():
                 driver = webdriver.Chrome(options=chrome_options)
             
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        yield driver
+        return driver
     except Exception as e:
         logger.error(f"Failed to initialize Selenium driver: {e}")
-        yield None
-    finally:
-        if driver:
-            driver.quit()
+        return None
 
-def extract_metadata(soup, url):
-    """Extract comprehensive metadata from HTML"""
-    metadata = {
-        'title': None,
-        'authors': [],
-        'publish_date': None,
-        'description': None,
-        'keywords': [],
-        'images': [],
-        'canonical_url': url,
-        'site_name': None,
-        'language': None,
-    }
+class SeleniumPool:
+    """Bounded pool of long-lived Chrome drivers, recycled after max_uses pages"""
     
-    # Extract title
-    title_candidates = [
-        soup.find('meta', property='og:title'),
-        soup.find('meta', attrs={'name': 'twitter:title'}),
-        soup.find('h1'),
-        soup.find('title')
-    ]
-    for candidate in title_candidates:
-        if candidate:
-            metadata['title'] = candidate.get('content') or candidate.text.strip()
-            break
+    def __init__(self, size=3, max_uses=50):
+        self.max_uses = max_uses
+        self._uses = {}
+        # Each slot holds a live driver, or None if it must be (re)launched
+        self._slots = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._slots.put(launch_selenium_driver())
     
-    # Extract authors
-    author_selectors = [
-        ('meta', {'name': 'author'}),
-        ('meta', {'property': 'article:author'}),
-        ('meta', {'name': 'article:author'}),
-        ('span', {'class': re.compile(r'author|byline', re.I)}),
-        ('div', {'class': re.compile(r'author|byline', re.I)}),
-        ('a', {'rel': 'author'}),
-        ('p', {'class': re.compile(r'author|byline', re.I)}),
-    ]
-    for tag, attrs in author_selectors:
-        elements = soup.find_all(tag, attrs)
-        for elem in elements:
-            author = elem.get('content') or elem.text.strip()
-            if author and author not in metadata['authors']:
-                metadata['authors'].append(author)
+    def acquire(self, timeout=30):
+        """Take a driver from the pool, launching one if the slot is empty"""
+        try:
+            driver = self._slots.get(timeout=timeout)
+        except queue.Empty:
+            logger.warning("Timed out waiting for a pooled Selenium driver")
+            return None
+        if driver is None:
+            driver = launch_selenium_driver()
+            if driver is None:
+                self._slots.put(None)
+        return driver
     
-    # Extract publish date
-    date_selectors = [
-        ('meta', {'property': 'article:published_time'}),
-        ('meta', {'name': 'publish_date'}),
-        ('meta', {'name': 'date'}),
-        ('time', {'datetime': True}),
-        ('span', {'class': re.compile(r'date|published', re.I)}),
-    ]
-    for tag, attrs in date_selectors:
-        elem = soup.find(tag, attrs)
-        if elem:
-            metadata['publish_date'] = elem.get('content') or elem.get('datetime') or elem.text.strip()
-            break
+    def release(self, driver):
+        """Reset a driver for the next URL and return it to the pool"""
+        uses = self._uses.get(driver, 0) + 1
+        if uses < self.max_uses:
+            try:
+                # Start the next page in a fresh tab with no leftover cookies
+                driver.delete_all_cookies()
+                old_handle = driver.current_window_handle
+                driver.switch_to.new_window('tab')
+                new_handle = driver.current_window_handle
+                driver.switch_to.window(old_handle)
+                driver.close()
+                driver.switch_to.window(new_handle)
+                self._uses[driver] = uses
+                self._slots.put(driver)
+                return
+            except Exception as e:
+                logger.warning(f"Failed to reset Selenium driver, recycling it: {e}")
+        self._discard(driver)
+        self._slots.put(None)
     
-    # Extract description
-    desc = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', property='og:description')
-    if desc:
-        metadata['description'] = desc.get('content')
+    def close(self):
+        """Quit every idle driver in the pool"""
+        while True:
+            try:
+                driver = self._slots.get_nowait()
+            except queue.Empty:
+                break
+            if driver is not None:
+                self._discard(driver)
     
-    # Extract keywords
-    keywords_meta = soup.find('meta', attrs={'name': 'keywords'})
-    if keywords_meta:
-        metadata['keywords'] = [k.strip() for k in keywords_meta.get('content', '').split(',')]
+    def _discard(self, driver):
+        self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+_selenium_pool = None
+_selenium_pool_lock = threading.Lock()
+
+def get_selenium_pool():
+    """Create the shared Selenium pool on first use"""
+    global _selenium_pool
+    with _selenium_pool_lock:
+        if _selenium_pool is None:
+            _selenium_pool = SeleniumPool(size=int(os.environ.get('SELENIUM_POOL_SIZE', 3)))
+            atexit.register(_selenium_pool.close)
+        return _selenium_pool
+
+@contextmanager
+def get_selenium_driver():
+    """Context manager lending a pooled Selenium WebDriver"""
+    if not SELENIUM_AVAILABLE:
+        logger.warning("Selenium not available, skipping")
+        yield None
+        return
     
-    # Extract images
-    images = []
-    og_image = soup.find('meta', property='og:image')
-    if og_image:
-        images.append(og_image.get('content'))
+    pool = get_selenium_pool()
+    driver = pool.acquire()
+    try:
+        yield driver
+    finally:
+        if driver:
+            pool.release(driver)
+
+# Compiled XPath queries for metadata, each evaluated against one lxml parse
+_XPATH_NS = {'re': 'http://exslt.org/regular-expressions'}
+# Elements whose class matches a pattern, case-insensitively
+_CLASS_MATCH = "[re:test(@class, '{}', 'i')]"
+TITLE_XPATHS = [
+    etree.XPath("//meta[@property='og:title']/@content"),
+    etree.XPath("//meta[@name='twitter:title']/@content"),
+    etree.XPath("//h1"),
+    etree.XPath("//title"),
+]
+AUTHOR_XPATHS = [
+    etree.XPath("//meta[@name='author']/@content"),
+    etree.XPath("//meta[@property='article:author']/@content"),
+    etree.XPath("//meta[@name='article:author']/@content"),
+    etree.XPath("//span" + _CLASS_MATCH.format('author|byline'), namespaces=_XPATH_NS),
+    etree.XPath("//div" + _CLASS_MATCH.format('author|byline'), namespaces=_XPATH_NS),
+    etree.XPath("//a[contains(concat(' ', normalize-space(@rel), ' '), ' author ')]"),
+    etree.XPath("//p" + _CLASS_MATCH.format('author|byline'), namespaces=_XPATH_NS),
+]
+DATE_XPATHS = [
+    etree.XPath("//meta[@property='article:published_time']/@content"),
+    etree.XPath("//meta[@name='publish_date']/@content"),
+    etree.XPath("//meta[@name='date']/@content"),
+    etree.XPath("//time/@datetime"),
+    etree.XPath("//span" + _CLASS_MATCH.format('date|published'), namespaces=_XPATH_NS),
+]
+DESCRIPTION_XPATHS = [
+    etree.XPath("//meta[@name='description']/@content"),
+    etree.XPath("//meta[@property='og:description']/@content"),
+]
+KEYWORDS_XPATH = etree.XPath("//meta[@name='keywords']/@content")
+OG_IMAGE_XPATH = etree.XPath("//meta[@property='og:image']/@content")
+IMAGE_XPATH = etree.XPath("//img/@src")
+CANONICAL_XPATH = etree.XPath("//link[@rel='canonical']/@href")
+SITE_NAME_XPATH = etree.XPath("//meta[@property='og:site_name']/@content")
+LANGUAGE_XPATH = etree.XPath("//html/@lang")
+
+UTF8_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+def parse_html(content):
+    """Parse an HTML document (bytes or str) into an lxml tree"""
+    if isinstance(content, bytes):
+        # Detect the charset the way BeautifulSoup does; lxml alone assumes latin-1
+        content = UnicodeDammit(content, is_html=True).unicode_markup
+    try:
+        return lxml.html.fromstring(content)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration
+        return lxml.html.fromstring(content.encode('utf-8'), parser=UTF8_PARSER)
+
+def _node_text(node):
+    """Return an attribute value or the stripped text of an element"""
+    if isinstance(node, str):
+        return node.strip()
+    return node.text_content().strip()
+
+def _first_text(tree, xpaths):
+    """Return the first non-empty value from a prioritised list of XPaths"""
+    for xpath in xpaths:
+        for node in xpath(tree):
+            text = _node_text(node)
+            if text:
+                return text
+    return None
+
+def extract_metadata(tree, url):
+    """Extract comprehensive metadata from an lxml HTML tree"""
+    authors = []
+    for xpath in AUTHOR_XPATHS:
+        for node in xpath(tree):
+            author = _node_text(node)
+            if author and author not in authors:
+                authors.append(author)
+    
+    keywords_meta = KEYWORDS_XPATH(tree)
+    keywords = [k.strip() for k in keywords_meta[0].split(',')] if keywords_meta else []
     
-    for img in soup.find_all('img', src=True)[:10]:  # Limit to first 10 images
-        img_url = urljoin(url, img['src'])
+    # og:image first, then the first 10 inline images
+    images = list(OG_IMAGE_XPATH(tree)[:1])
+    for src in IMAGE_XPATH(tree)[:10]:
+        img_url = urljoin(url, src)
         if img_url not in images:
             images.append(img_url)
     
-    metadata['images'] = images
-    
-    # Extract canonical URL
-    canonical = soup.find('link', rel='canonical')
-    if canonical:
-        metadata['canonical_url'] = canonical.get('href')
-    
-    # Extract site name
-    site_name = soup.find('meta', property='og:site_name')
-    if site_name:
-        metadata['site_name'] = site_name.get('content')
+    canonical = CANONICAL_XPATH(tree)
+    site_name = SITE_NAME_XPATH(tree)
+    language = LANGUAGE_XPATH(tree)
     
-    # Extract language
-    html_tag = soup.find('html')
-    if html_tag:
-        metadata['language'] = html_tag.get('lang')
-    
-    return metadata
+    return {
+        'title': _first_text(tree, TITLE_XPATHS),
+        'authors': authors,
+        'publish_date': _first_text(tree, DATE_XPATHS),
+        'description': _first_text(tree, DESCRIPTION_XPATHS),
+        'keywords': keywords,
+        'images': images,
+        'canonical_url': canonical[0] if canonical else url,
+        'site_name': site_name[0] if site_name else None,
+        'language': language[0] if language else None,
+    }
+
+# Elements dropped before content extraction
+UNWANTED_TAGS = ('script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript')
+SCRIPT_TAGS = ('script', 'style')
 
-def extract_tables(soup):
-    """Extract all tables from the page"""
+# Main-content containers, in priority order, as compiled XPath queries
+CONTENT_XPATHS = [
+    etree.XPath("//article"),
+    etree.XPath("//div[re:test(@class, 'article|content|post|entry|main|story', 'i')]", namespaces=_XPATH_NS),
+    etree.XPath("//div[re:test(@id, 'article|content|post|entry|main|story', 'i')]", namespaces=_XPATH_NS),
+    etree.XPath("//main"),
+    etree.XPath("//section[re:test(@class, 'article|content', 'i')]", namespaces=_XPATH_NS),
+    etree.XPath("//*[@role='main']"),
+    etree.XPath("//div[@itemprop='articleBody']"),
+]
+SELENIUM_CONTENT_XPATHS = [
+    etree.XPath("//article"),
+    etree.XPath("//*[@role='main']"),
+    etree.XPath("//div[contains(@class, 'article')]"),
+    etree.XPath("//div[contains(@class, 'content')]"),
+    etree.XPath("//div[contains(@class, 'post')]"),
+    etree.XPath("//main"),
+]
+PARAGRAPH_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li')
+SELENIUM_PARAGRAPH_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'li')
+
+def strip_text(elem):
+    """Concatenate an element's stripped text nodes, like BeautifulSoup's get_text(strip=True)"""
+    return ''.join(t.strip() for t in elem.itertext())
+
+def extract_paragraphs(tree, content_xpaths, paragraph_tags):
+    """Collect unique paragraph texts from content containers, returning (paragraphs, total length)"""
+    text_content = []
+    seen = set()
+    text_length = 0
+    for content_xpath in content_xpaths:
+        for elem in content_xpath(tree):
+            for p in elem.iter(*paragraph_tags):
+                # iter() includes the container itself; find_all() never did
+                if p is elem:
+                    continue
+                p_text = strip_text(p)
+                # Filter out short fragments and paragraphs matched by an earlier selector
+                if len(p_text) > 20 and p_text not in seen:
+                    seen.add(p_text)
+                    text_content.append(p_text)
+                    text_length += len(p_text)
+        # Higher-priority selectors already found enough content
+        if text_length > 2000:
+            break
+    return text_content, text_length
+
+def extract_tables(tree):
+    """Extract all tables from an lxml HTML tree"""
     tables = []
-    for table in soup.find_all('table'):
+    for table in tree.iter('table'):
         table_data = []
-        for row in table.find_all('tr'):
-            row_data = [cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])]
+        for row in table.iter('tr'):
+            row_data = [strip_text(cell) for cell in row.iter('td', 'th')]
             if row_data:
                 table_data.append(row_data)
         if table_data:
             tables.append(table_data)
     return tables
 
+WHITESPACE_RE = re.compile(r'\s+')
+BOILERPLATE_RE = re.compile(r'(Accept all cookies|Subscribe to newsletter|Sign up|Login|Register)', re.I)
+
 def clean_text(text):
     """Clean and normalize text"""
     if not text:
         return ''
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RE.sub(' ', text)
     # Remove common boilerplate
-    text = re.sub(r'(Accept all cookies|Subscribe to newsletter|Sign up|Login|Register)', '', text, flags=re.I)
+    text = BOILERPLATE_RE.sub('', text)
     return text.strip()
 
 # Fallback Strategy 1: Newspaper3k
@@ -249,11 +504,6 @@ def scrape_with_newspaper(url):
         article.download()
         article.parse()
         
-        try:
-            article.nlp()  # Extract keywords and summary
-        except:
-            pass
-        
         if article.text and len(article.text) > 100:
             return {
                 'method': 'newspaper3k',
@@ -263,8 +513,9 @@ def scrape_with_newspaper(url):
                 'text': clean_text(article.text),
                 'top_image': article.top_image,
                 'images': article.images,
-                'keywords': article.keywords,
-                'summary': article.summary,
+                # Skip article.nlp(): meta keywords and a leading excerpt are free
+                'keywords': [k for k in article.meta_keywords if k],
+                'summary': article.text[:500] + '...' if len(article.text) > 500 else article.text,
                 'source': url,
                 'success': True
             }
@@ -305,15 +556,14 @@ def scrape_with_readability(url):
     """Use readability-lxml for content extraction"""
     try:
         logger.info(f"Attempting scrape with Readability: {url}")
-        response = requests.get(url, headers=get_random_headers(), timeout=15)
+        response = fetch_page(url)
         doc = Document(response.content)
         
-        soup = BeautifulSoup(doc.summary(), 'html.parser')
+        soup = BeautifulSoup(doc.summary(), 'lxml')
         text = soup.get_text(separator=' ', strip=True)
         
         # Get metadata from original page
-        original_soup = BeautifulSoup(response.content, 'html.parser')
-        metadata = extract_metadata(original_soup, url)
+        metadata = extract_metadata(parse_html(response.content), url)
         
         if text and len(text) > 100:
             return {
@@ -327,7 +577,8 @@ def scrape_with_readability(url):
                 'keywords': metadata['keywords'],
                 'summary': text[:500] + '...' if len(text) > 500 else text,
                 'source': url,
-                'success': True
+                'success': True,
+                '_fetch_status': response.status_code,
             }
     except Exception as e:
         logger.warning(f"Readability failed: {str(e)}")
@@ -339,66 +590,37 @@ def scrape_with_beautifulsoup(url):
     try:
         logger.info(f"Attempting scrape with BeautifulSoup: {url}")
         
-        # Try multiple request attempts with different headers
-        for attempt in range(3):
-            try:
-                response = requests.get(url, headers=get_random_headers(), timeout=15, allow_redirects=True)
-                response.raise_for_status()
-                break
-            except Exception as e:
-                if attempt == 2:
-                    raise e
-                time.sleep(random.uniform(1, 3))
+        # Retries with backoff are handled by the session's HTTPAdapter
+        response = fetch_page(url)
+        response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = parse_html(response.content)
         
         # Remove unwanted elements
-        for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript']):
-            tag.decompose()
-        
-        # Extract metadata
-        metadata = extract_metadata(soup, url)
+        etree.strip_elements(tree, *UNWANTED_TAGS, with_tail=False)
+        metadata = extract_metadata(tree, url)
         
         # Extract main content with comprehensive selectors
-        content_selectors = [
-            ('article', {}),
-            ('div', {'class': re.compile(r'article|content|post|entry|main|story', re.I)}),
-            ('div', {'id': re.compile(r'article|content|post|entry|main|story', re.I)}),
-            ('main', {}),
-            ('section', {'class': re.compile(r'article|content', re.I)}),
-            ('[role="main"]', {}),
-            ('div', {'itemprop': 'articleBody'}),
-        ]
-        
-        text_content = []
-        for tag, attrs in content_selectors:
-            elements = soup.find_all(tag, attrs) if attrs else soup.find_all(tag)
-            for elem in elements:
-                # Extract paragraphs
-                paragraphs = elem.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li'])
-                for p in paragraphs:
-                    p_text = p.get_text(strip=True)
-                    if len(p_text) > 20:  # Filter out short fragments
-                        text_content.append(p_text)
+        text_content, text_length = extract_paragraphs(tree, CONTENT_XPATHS, PARAGRAPH_TAGS)
         
         # Extract tables
-        tables = extract_tables(soup)
-        
-        # Combine all text
-        text = ' '.join(text_content)
+        tables = extract_tables(tree)
         
-        # Add table content to text
+        # Table content appended to text
+        table_text = ''
         if tables:
             table_text = '\n\nTables:\n'
             for i, table in enumerate(tables):
                 table_text += f'\nTable {i+1}:\n'
                 for row in table:
                     table_text += ' | '.join(row) + '\n'
-            text += table_text
         
-        # Fallback: get all text if content is too short
-        if len(text) < 200:
+        # Fallback: get all text if content is too short; only join when it will be kept
+        if text_length + max(0, len(text_content) - 1) + len(table_text) < 200:
+            soup = BeautifulSoup(lxml.html.tostring(tree), 'lxml')
             text = soup.get_text(separator=' ', strip=True)
+        else:
+            text = ' '.join(text_content) + table_text
         
         if text and len(text) > 50:
             return {
@@ -442,54 +664,42 @@ def scrape_with_selenium(url):
             except:
                 time.sleep(3)  # Fallback wait
             
-            # Scroll to load lazy content
+            # Scroll to load lazy content, then wait for paragraphs rather than a fixed delay
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(1)
+            try:
+                WebDriverWait(driver, 2).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "p"))
+                )
+            except Exception:
+                pass
             
             page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            tree = parse_html(page_source)
             
             # Remove unwanted elements
-            for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe']):
-                tag.decompose()
-            
-            metadata = extract_metadata(soup, url)
+            etree.strip_elements(tree, *UNWANTED_TAGS, with_tail=False)
+            metadata = extract_metadata(tree, url)
             
             # Extract content
-            content_selectors = [
-                'article',
-                '[role="main"]',
-                'div[class*="article"]',
-                'div[class*="content"]',
-                'div[class*="post"]',
-                'main'
-            ]
-            
-            text_content = []
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                for elem in elements:
-                    paragraphs = elem.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'li'])
-                    for p in paragraphs:
-                        p_text = p.get_text(strip=True)
-                        if len(p_text) > 20:
-                            text_content.append(p_text)
-            
-            text = ' '.join(text_content)
+            text_content, text_length = extract_paragraphs(tree, SELENIUM_CONTENT_XPATHS, SELENIUM_PARAGRAPH_TAGS)
             
             # Extract tables
-            tables = extract_tables(soup)
+            tables = extract_tables(tree)
             
+            table_text = ''
             if tables:
                 table_text = '\n\nTables:\n'
                 for i, table in enumerate(tables):
                     table_text += f'\nTable {i+1}:\n'
                     for row in table:
                         table_text += ' | '.join(row) + '\n'
-                text += table_text
             
-            if len(text) < 200:
+            # Only join the paragraphs when they won't be replaced by the full page text
+            if text_length + max(0, len(text_content) - 1) + len(table_text) < 200:
+                soup = BeautifulSoup(lxml.html.tostring(tree), 'lxml')
                 text = soup.get_text(separator=' ', strip=True)
+            else:
+                text = ' '.join(text_content) + table_text
             
             if text and len(text) > 50:
                 return {
@@ -515,16 +725,16 @@ def scrape_raw(url):
     """Last resort: extract everything from the page"""
     try:
         logger.info(f"Attempting raw scrape: {url}")
-        response = requests.get(url, headers=get_random_headers(), timeout=15)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = fetch_page(url)
+        tree = parse_html(response.content)
+        metadata = extract_metadata(tree, url)
         
         # Remove scripts and styles
-        for tag in soup(['script', 'style']):
-            tag.decompose()
+        etree.strip_elements(tree, *SCRIPT_TAGS, with_tail=False)
+        soup = BeautifulSoup(lxml.html.tostring(tree), 'lxml')
         
-        metadata = extract_metadata(soup, url)
         text = soup.get_text(separator=' ', strip=True)
-        tables = extract_tables(soup)
+        tables = extract_tables(tree)
         
         return {
             'method': 'raw',
@@ -538,12 +748,120 @@ def scrape_raw(url):
             'summary': text[:500] + '...' if len(text) > 500 else text,
             'tables': tables,
             'source': url,
-            'success': True
+            'success': True,
+            # Error pages (e.g. 403 bot challenges) are returned but must not be cached
+            '_fetch_status': response.status_code,
         }
     except Exception as e:
         logger.error(f"Raw scrape failed: {str(e)}")
         return None
 
+# Strategies raced concurrently on every request
+PARALLEL_STRATEGIES = [
+    scrape_with_newspaper,
+    scrape_with_trafilatura,
+    scrape_with_readability,
+    scrape_with_beautifulsoup,
+]
+
+# Strategies tried in order only when every parallel strategy fails
+FALLBACK_STRATEGIES = [
+    scrape_with_selenium,
+    scrape_raw,
+]
+
+def revalidate(url, validators):
+    """Conditionally GET the page, returning True if the origin answers 304 Not Modified"""
+    headers = dict(get_random_headers())
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    # Stream so a changed page's body is never downloaded here
+    with SESSION.get(url, headers=headers, timeout=15, stream=True) as response:
+        return response.status_code == 304
+
+def get_cached_payload(url, cache_key):
+    """Return a cached JSON payload that is fresh or revalidated by a 304, else None"""
+    entry = CACHE.get(cache_key)
+    if not entry or 'payload' not in entry:
+        return None
+    if time.time() - entry['stored_at'] < CACHE_TTL:
+        return entry['payload']
+    validators_key = cache_key + ':validators'
+    validators = CACHE.get(validators_key)
+    if not validators:
+        return None
+    try:
+        if not revalidate(url, validators):
+            return None
+    except Exception as e:
+        logger.warning(f"Cache revalidation failed for {url}: {str(e)}")
+        return None
+    entry['stored_at'] = time.time()
+    CACHE.set(cache_key, entry, expire=CACHE_RETENTION)
+    CACHE.touch(validators_key, expire=CACHE_RETENTION)
+    return entry['payload']
+
+def run_strategies(url):
+    """Run the scraping strategies, returning the first successful result or None"""
+    # Race the independent extractors and keep the first successful result
+    result = None
+    executor = ThreadPoolExecutor(max_workers=len(PARALLEL_STRATEGIES))
+    try:
+        futures = [executor.submit(strategy, url) for strategy in PARALLEL_STRATEGIES]
+        for future in as_completed(futures):
+            candidate = future.result()
+            if candidate and candidate.get('success'):
+                result = candidate
+                break
+    finally:
+        # Don't wait for slower strategies once we have a winner
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    # Fall back to the heavier strategies only if all of the above failed
+    if not result:
+        for strategy in FALLBACK_STRATEGIES:
+            result = strategy(url)
+            if result and result.get('success'):
+                break
+    return result
+
+def scrape_url(url, cache_key):
+    """Scrape a URL into a serialized JSON payload, serving and populating the result cache"""
+    cached = get_cached_payload(url, cache_key)
+    if cached:
+        logger.info(f"Serving cached result for: {url}")
+        return cached
+    
+    logger.info(f"Scraping request for: {url}")
+    start_time = time.time()
+    
+    result = run_strategies(url)
+    if not result:
+        return None
+    
+    # Add scraping metadata
+    result['scrape_time'] = round(time.time() - start_time, 2)
+    result['timestamp'] = datetime.utcnow().isoformat()
+    
+    logger.info(f"Successfully scraped {url} using {result.get('method')} in {result['scrape_time']}s")
+    
+    # Strategies that parse whatever page came back report its HTTP status
+    fetch_status = result.pop('_fetch_status', 200)
+    
+    # Serialize once; the bytes are cached and shared with coalesced callers
+    payload = app.json.dumps_bytes(result)
+    if fetch_status == 200:
+        CACHE.set(cache_key, {
+            'payload': payload,
+            'stored_at': time.time(),
+        }, expire=CACHE_RETENTION)
+    else:
+        logger.info(f"Not caching {url}: page fetch returned HTTP {fetch_status}")
+    
+    return payload
+
 @app.route('/scrape', methods=['GET', 'POST'])
 def scrape():
     """Main scraping endpoint with cascading fallback strategies"""
@@ -563,45 +881,17 @@ def scrape():
         if not parsed.scheme or not parsed.netloc:
             return jsonify({'error': 'Invalid URL format', 'success': False}), 400
         
-        logger.info(f"Scraping request for: {url}")
-        start_time = time.time()
+        cache_key = get_cache_key(url)
+        payload = coalesce(cache_key, scrape_url, url, cache_key)
         
-        # Try all fallback strategies in order
-        strategies = [
-            scrape_with_newspaper,
-            scrape_with_trafilatura,
-            scrape_with_readability,
-            scrape_with_beautifulsoup,
-            scrape_with_selenium,
-            scrape_raw
-        ]
-        
-        result = None
-        for strategy in strategies:
-            result = strategy(url)
-            if result and result.get('success'):
-                break
-            time.sleep(random.uniform(0.5, 1.5))  # Random delay between attempts
-        
-        if not result:
+        if not payload:
             return jsonify({
                 'error': 'All scraping methods failed',
                 'success': False,
                 'url': url
             }), 500
         
-        # Add scraping metadata
-        result['scrape_time'] = round(time.time() - start_time, 2)
-        result['timestamp'] = datetime.utcnow().isoformat()
-        
-        logger.info(f"Successfully scraped {url} using {result.get('method')} in {result['scrape_time']}s")
-
-        # Convert sets to lists for JSON serialization
-        for key, value in result.items():
-            if isinstance(value, set):
-                result[key] = list(value)
-        
-        return jsonify(result)
+        return app.response_class(payload, mimetype='application/json')
     
     except Exception as e:
         logger.error(f"Scraping error: {str(e)}", exc_info=True)